@@ -46,6 +46,8 @@ minuteToSecondIntervalRegEx = re.compile("^(-?)(\d+):(\d+\.?\d*)$")
 secondIntervalRegEx = re.compile("^(-?)(\d+\.?\d*)$")
 periodRegEx1 = re.compile("\('(.*)',\s*'(.*)'\)")
 periodRegEx2 = re.compile("ResultStruct:PERIOD\(.*\)\[(.*),\s*(.*)\]")
+jsonDecoder = json.JSONDecoder(parse_int=decimal.Decimal,
+                               parse_float=decimal.Decimal)
 
 NUMBER_TYPES = {"BYTEINT", "BIGINT", "DECIMAL", "DOUBLE", "DOUBLE PRECISION",
                 "INTEGER", "NUMBER", "SMALLINT", "FLOAT", "INT", "NUMERIC",
@@ -75,7 +77,19 @@ def _getFloat(m, num):
     return float(m.group(num))
 
 
+# date.fromisoformat is only available in Python 3.7 and above.
+_dateFromIsoFormat = getattr(datetime.date, "fromisoformat", None)
+
+
 def convertDate(value):
+    # Only take the fast path for YYYY-MM-DD; newer Pythons also accept
+    # other 10 character ISO forms such as week dates (2024-W01-1).
+    if _dateFromIsoFormat is not None and len(value) == 10 and \
+            value[4] == '-' and value[7] == '-':
+        try:
+            return _dateFromIsoFormat(value)
+        except ValueError:
+            pass
     m = dateRegEx.match(value)
     if m:
         return datetime.date(_getInt(m, 1), _getInt(m, 2), _getInt(m, 3))
@@ -89,7 +103,7 @@ def convertTime(value):
     if m:
         tz = None
         if m.group(7):
-            tz = TimeZone(m.group(7), _getInt(m, 8), _getInt(m, 9))
+            tz = getTimeZone(m.group(7), _getInt(m, 8), _getInt(m, 9))
         return datetime.time(_getInt(m, 1), _getInt(m, 2), _getInt(m, 3),
                              _getMs(m, 5), tz)
     else:
@@ -102,7 +116,8 @@ def convertTimestamp(value):
     if m:
         tz = None
         if m.group(10):
-            tz = TimeZone(m.group(10), _getInt(m, 11), _getInt(m, 12))
+            tz = getTimeZone(m.group(10), _getInt(m, 11),
+                             _getInt(m, 12))
         return datetime.datetime(_getInt(m, 1), _getInt(m, 2), _getInt(m, 3),
                                  _getInt(m, 4), _getInt(m, 5), _getInt(m, 6),
                                  _getMs(m, 8), tz)
@@ -273,8 +288,7 @@ class DefaultDataTypeConverter (DataTypeConverter):
             elif dataType.startswith("INTERVAL"):
                 return convertInterval(dataType, value)
             elif dataType.startswith("JSON") and util.isString(value):
-                return json.loads(value, parse_int=decimal.Decimal,
-                                  parse_float=decimal.Decimal)
+                return jsonDecoder.decode(value)
             elif dataType.startswith("PERIOD"):
                 return convertPeriod(dataType, value)
         return value
@@ -316,6 +330,18 @@ class TimeZone (datetime.tzinfo):
         return 0
 
 
+_timeZones = {}
+
+
+def getTimeZone(sign, hours, minutes):
+    """Returns a shared TimeZone instance for the given UTC offset."""
+    key = (sign, hours, minutes)
+    tz = _timeZones.get(key)
+    if tz is None:
+        tz = _timeZones.setdefault(key, TimeZone(sign, hours, minutes))
+    return tz
+
+
 def _appendInterval(arr, value, padding=2, separator=" "):
     if value is not None:
         if arr and separator:
@@ -440,6 +466,9 @@ class Period:
     def __str__(self):
         return "('" + str(self.start) + "', '" + str(self.end) + "')"
 
+    def __repr__(self):
+        return str(self.__dict__)
+
     def __eq__(self, other):
         try:
             return self.__dict__ == other.__dict__
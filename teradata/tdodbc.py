@@ -90,6 +90,9 @@ PTR = ctypes.POINTER
 ERROR_BUFFER_SIZE = 2 ** 10
 SMALL_BUFFER_SIZE = 2 ** 12
 LARGE_BUFFER_SIZE = 2 ** 20
+# Upper bound on the column buffers bound for a single SQLFetch. Larger
+# fetch sizes are served by fetching several blocks of rows.
+MAX_FETCH_BUFFER_SIZE = 2 ** 24
 TRUE = 1
 FALSE = 0
 
@@ -615,12 +618,13 @@ class OdbcCursor (util.Cursor):
         self._handleResults()
         return self
 
-    def executemany(self, query, params, batch=False, queryTimeout=0):
+    def executemany(self, query, params, batch=False, queryTimeout=0,
+                    maxBatchBytes=None):
         self._checkClosed()
         self._free()
         # Prepare the query
-        rc = odbc.SQLPrepareW(
-            self.hStmt, _inputStr(_convertLineFeeds(query)), SQL_NTS)
+        queryStr = _inputStr(_convertLineFeeds(query))
+        rc = odbc.SQLPrepareW(self.hStmt, queryStr, SQL_NTS)
         checkStatus(rc, hStmt=self.hStmt, method="SQLPrepare")
         self._setQueryTimeout(queryTimeout)
         # Get the number of parameters in the SQL statement.
@@ -640,17 +644,34 @@ class OdbcCursor (util.Cursor):
                 ADDR(decimalDigits), ADDR(nullable))
             checkStatus(rc, hStmt=self.hStmt, method="SQLDescribeParams")
             dataTypes.append(dataType.value)
+        if batch and not params:
+            # An empty batch executes nothing, so there are no results.
+            logger.debug("Skipping execution of empty batch: %s", query)
+            self.description = None
+            self.rowcount = 0
+            self.rownumber = None
+            self.columns = {}
+            self.types = []
+            self.moreResults = False
+            self.iterator = None
+            return self
         if batch:
             logger.debug(
                 "Executing query on session %s using batched SQLExecute: %s",
                 self.connection.sessionno, query)
-            self._executeManyBatch(params, numParams, dataTypes)
+            batchRowCount = self._executeManyBatch(
+                params, numParams, dataTypes, ctypes.sizeof(queryStr),
+                maxBatchBytes)
         else:
             logger.debug(
                 "Executing query on session %s using SQLExecute: %s",
                 self.connection.sessionno, query)
             rc = odbc.SQLSetStmtAttr(self.hStmt, SQL_ATTR_PARAMSET_SIZE, 1, 0)
             checkStatus(rc, hStmt=self.hStmt, method="SQLSetStmtAttr")
+            # The value and parameter types only depend on the prepared
+            # statement, so resolve them once rather than per parameter set.
+            paramValueTypes = [_getParamValueType(dataType)
+                               for dataType in dataTypes]
             paramSetNum = 0
             for p in params:
                 paramSetNum += 1
@@ -665,8 +686,7 @@ class OdbcCursor (util.Cursor):
                 for paramNum in range(0, numParams):
                     val = p[paramNum]
                     inputOutputType = _getInputOutputType(val)
-                    valueType, paramType = _getParamValueType(
-                        dataTypes[paramNum])
+                    valueType, paramType = paramValueTypes[paramNum]
                     param, length, null = _getParamValue(val, valueType, False)
                     paramArray.append(param)
                     if param is not None:
@@ -706,9 +726,12 @@ class OdbcCursor (util.Cursor):
                         val.size = lengthArray[paramNum].value
                 checkStatus(rc, hStmt=self.hStmt, method="SQLExecute")
         self._handleResults()
+        if batch and batchRowCount is not None:
+            self.rowcount = batchRowCount
         return self
 
-    def _executeManyBatch(self, params, numParams, dataTypes):
+    def _executeManyBatch(self, params, numParams, dataTypes, querySize,
+                          maxBatchBytes):
         # Get the number of parameter sets.
         paramSetSize = len(params)
         # Set the SQL_ATTR_PARAM_BIND_TYPE statement attribute to use
@@ -716,10 +739,6 @@ class OdbcCursor (util.Cursor):
         rc = odbc.SQLSetStmtAttr(
             self.hStmt, SQL_ATTR_PARAM_BIND_TYPE, SQL_PARAM_BIND_BY_COLUMN, 0)
         checkStatus(rc, hStmt=self.hStmt, method="SQLSetStmtAttr")
-        # Specify the number of elements in each parameter array.
-        rc = odbc.SQLSetStmtAttr(
-            self.hStmt, SQL_ATTR_PARAMSET_SIZE, paramSetSize, 0)
-        checkStatus(rc, hStmt=self.hStmt, method="SQLSetStmtAttr")
         # Specify a PTR to get the number of parameters processed.
         # paramsProcessed = SQLULEN()
         # rc = odbc.SQLSetStmtAttr(self.hStmt, SQL_ATTR_PARAMS_PROCESSED_PTR,
@@ -730,10 +749,6 @@ class OdbcCursor (util.Cursor):
         # rc = odbc.SQLSetStmtAttr(self.hStmt, SQL_ATTR_PARAM_STATUS_PTR,
         #                          ADDR(paramsStatus), SQL_IS_POINTER)
         # checkStatus(rc, hStmt=self.hStmt, method="SQLSetStmtAttr")
-        # Bind the parameters.
-        paramArrays = []
-        lengthArrays = []
-        paramSetSize = len(params)
         paramSetNum = 0
         debugEnabled = logger.isEnabledFor(logging.DEBUG)
         for p in params:
@@ -745,6 +760,10 @@ class OdbcCursor (util.Cursor):
                     "PARAMS_MISMATCH", "The number of supplied parameters "
                     "({}) does not match the expected number of parameters "
                     "({}).".format(len(p), numParams))
+        # Convert the parameter values and size the parameter arrays.
+        columns = []
+        rowSize = 0
+        charSize = ctypes.sizeof(_createBuffer(1))
         for paramNum in range(0, numParams):
             p = []
             valueType, paramType = _getParamValueType(dataTypes[paramNum])
@@ -760,27 +779,95 @@ class OdbcCursor (util.Cursor):
                              paramNum + 1, maxLen)
             if valueType == SQL_C_BINARY:
                 valueSize = SQLLEN(maxLen)
-                paramArrays.append((SQLBYTE * (paramSetSize * maxLen))())
+                rowSize += maxLen
             elif valueType == SQL_C_DOUBLE:
                 valueSize = SQLLEN(maxLen)
-                paramArrays.append((SQLDOUBLE * paramSetSize)())
+                rowSize += ctypes.sizeof(SQLDOUBLE)
             else:
                 maxLen += 1
                 valueSize = SQLLEN(ctypes.sizeof(SQLWCHAR) * maxLen)
+                # Count what _createBuffer allocates, which can be more than
+                # the bound buffer length.
+                rowSize += charSize * maxLen
+            rowSize += ctypes.sizeof(SQLLEN)
+            columns.append((p, valueType, paramType, maxLen, valueSize))
+        # The batch is sent as a single request unless maxBatchBytes is
+        # given. Each chunk is then its own request, so with auto commit a
+        # failure in a later chunk does not undo the chunks before it.
+        chunkSize = paramSetSize
+        if maxBatchBytes is not None:
+            if querySize + rowSize > maxBatchBytes:
+                raise InterfaceError(
+                    "MAX_BATCH_BYTES", "A single parameter set ({} bytes "
+                    "including the query) does not fit within maxBatchBytes "
+                    "({}).".format(querySize + rowSize, maxBatchBytes))
+            chunkSize = (maxBatchBytes - querySize) // max(rowSize, 1)
+        if chunkSize < paramSetSize:
+            logger.info(
+                "Splitting %s parameter sets into requests of at most %s "
+                "parameter sets to stay within %s bytes.", paramSetSize,
+                chunkSize, maxBatchBytes)
+        rowCount = 0
+        for chunkStart in range(0, paramSetSize, chunkSize):
+            chunkEnd = min(chunkStart + chunkSize, paramSetSize)
+            self._executeParamArrays(
+                columns, chunkStart, chunkEnd, debugEnabled)
+            if chunkEnd < paramSetSize:
+                # Read the results of every chunk but the last, which the
+                # caller handles, so their errors and warnings are reported.
+                self._handleResults()
+                rowCount += self.rowcount
+                self._drainResults()
+            elif chunkSize < paramSetSize:
+                chunkRowCount = SQLLEN()
+                rc = odbc.SQLRowCount(self.hStmt, ADDR(chunkRowCount))
+                checkStatus(rc, hStmt=self.hStmt, method="SQLRowCount")
+                rowCount += chunkRowCount.value
+        return rowCount if chunkSize < paramSetSize else None
+
+    def _drainResults(self):
+        # Consume all remaining result sets, which closes the statement once
+        # the last one is read.
+        while True:
+            for row in self.iterator:  # @UnusedVariable
+                pass
+            if not self.moreResults:
+                break
+            self._handleResults()
+
+    def _executeParamArrays(self, columns, chunkStart, chunkEnd,
+                            debugEnabled):
+        # Specify the number of elements in each parameter array.
+        paramSetSize = chunkEnd - chunkStart
+        rc = odbc.SQLSetStmtAttr(
+            self.hStmt, SQL_ATTR_PARAMSET_SIZE, paramSetSize, 0)
+        checkStatus(rc, hStmt=self.hStmt, method="SQLSetStmtAttr")
+        # Bind the parameters.
+        paramArrays = []
+        lengthArrays = []
+        for paramNum in range(0, len(columns)):
+            p, valueType, paramType, maxLen, valueSize = columns[paramNum]
+            if valueType == SQL_C_BINARY:
+                paramArrays.append((SQLBYTE * (paramSetSize * maxLen))())
+            elif valueType == SQL_C_DOUBLE:
+                paramArrays.append((SQLDOUBLE * paramSetSize)())
+            else:
                 paramArrays.append(_createBuffer(paramSetSize * maxLen))
             lengthArrays.append((SQLLEN * paramSetSize)())
             for paramSetNum in range(0, paramSetSize):
                 index = paramSetNum * maxLen
-                if p[paramSetNum] is not None:
+                value = p[chunkStart + paramSetNum]
+                if value is not None:
                     if valueType == SQL_C_DOUBLE:
-                        paramArrays[paramNum][paramSetNum] = p[paramSetNum]
+                        paramArrays[paramNum][paramSetNum] = value
                     else:
-                        for c in p[paramSetNum]:
-                            paramArrays[paramNum][index] = c
-                            index += 1
+                        # Copy the whole value into its slot at once.
+                        end = index + len(value)
+                        paramArrays[paramNum][index:end] = value
+                        index = end
                         if valueType == SQL_C_BINARY:
                             lengthArrays[paramNum][
-                                paramSetNum] = len(p[paramSetNum])
+                                paramSetNum] = len(value)
                         else:
                             lengthArrays[paramNum][
                                 paramSetNum] = SQLLEN(SQL_NTS)
@@ -968,13 +1055,17 @@ def _getParamValue(val, valueType, batch):
 
 
 def _getFetchSize(cursor):
-    """Gets the fetch size associated with the cursor."""
-    fetchSize = cursor.fetchSize
+    """Gets the fetch size associated with the cursor, limited so the column
+    buffers for one fetch stay within MAX_FETCH_BUFFER_SIZE."""
     for dataType in cursor.types:
         if dataType[2] in (SQL_LONGVARBINARY, SQL_WLONGVARCHAR):
-            fetchSize = 1
-            break
-    return fetchSize
+            return 1
+    charSize = ctypes.sizeof(_createBuffer(1))
+    rowSize = 0
+    for col in range(1, len(cursor.description) + 1):
+        rowSize += _getBufSize(cursor, col) * charSize + \
+            ctypes.sizeof(SQLLEN)
+    return max(1, min(cursor.fetchSize, MAX_FETCH_BUFFER_SIZE // rowSize))
 
 
 def _getBufSize(cursor, colIndex):
@@ -1019,6 +1110,8 @@ def _setupColumnBuffers(cursor, buffers, bufSizes, dataTypes, indicators,
             cursor.hStmt, SQL_ATTR_ROW_ARRAY_SIZE, fetchSize, 0)
         checkStatus(rc, hStmt=cursor.hStmt,
                     method="SQLSetStmtAttr - SQL_ATTR_ROW_ARRAY_SIZE")
+        # Discard the buffers bound for the previous fetch size.
+        del buffers[:], bufSizes[:], dataTypes[:], indicators[:]
         for col in range(1, len(cursor.description) + 1):
             dataType = SQL_C_WCHAR
             buffer = None
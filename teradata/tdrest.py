@@ -217,7 +217,10 @@ class RestCursor (util.Cursor):
             self._execute(query, params, queryTimeout=queryTimeout))
         return self
 
-    def executemany(self, query, params, batch=False, queryTimeout=None):
+    def executemany(self, query, params, batch=False, queryTimeout=None,
+                    maxBatchBytes=None):
+        # A REST batch is always sent as a single request, so maxBatchBytes
+        # is accepted for compatibility with the ODBC cursor and ignored.
         self._handleResults(
             self._execute(query, params, batch=batch,
                           queryTimeout=queryTimeout))
@@ -783,8 +783,12 @@ class UdaExecCursor:
         self.skip = self.udaexec.skip and not runAlways
         if not self.skip:
             start = time.time()
-            paramStr = _getParamsString(params, logParamFrequency,
-                                        logParamCharLimit)
+            # Formatting the parameters can be expensive for large batches,
+            # so only do it up front when the success message will be logged.
+            paramStr = None
+            if logger.isEnabledFor(logging.INFO):
+                paramStr = _getParamsString(params, logParamFrequency,
+                                            logParamCharLimit)
             try:
                 query = self.udaexec.config.resolve(query)
                 func(query, params, **kwargs)
@@ -803,6 +807,9 @@ class UdaExecCursor:
                 self.rowcount = -1
                 duration = time.time() - start
                 self.error = e
+                if paramStr is None:
+                    paramStr = _getParamsString(params, logParamFrequency,
+                                                logParamCharLimit)
                 if isinstance(e, api.DatabaseError) and e.code in ignoreErrors:
                     logger.error(
                         "Query Failed! Duration: %.3f seconds, Query: %s%s, "
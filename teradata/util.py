@@ -112,7 +112,7 @@ class Cursor:
         # Abstract method, defined by convention only
         raise NotImplementedError("Subclass must implement abstract method")
 
-    def executemany(self, query, params, batch=False):
+    def executemany(self, query, params, batch=False, maxBatchBytes=None):
         # Abstract method, defined by convention only
         raise NotImplementedError("Subclass must implement abstract method")
 
@@ -123,21 +123,26 @@ class Cursor:
     def fetchmany(self, size=None):
         if size is None:
             size = self.arraysize
+        if size < 1:
+            # A size below one has always returned all remaining rows.
+            return self.fetchall()
         self.fetchSize = size
         rows = []
-        count = 0
-        for row in self:
-            rows.append(row)
-            count += 1
-            if count == size:
-                break
+        try:
+            while len(rows) < size:
+                rows.append(self._nextRow())
+        except StopIteration:
+            pass
         return rows
 
     def fetchall(self):
         self.fetchSize = self.arraysize
         rows = []
-        for row in self:
-            rows.append(row)
+        try:
+            while True:
+                rows.append(self._nextRow())
+        except StopIteration:
+            pass
         return rows
 
     def nextset(self):
@@ -155,15 +160,21 @@ class Cursor:
 
     def __next__(self):
         self.fetchSize = self.arraysize
+        return self._nextRow()
+
+    def _nextRow(self):
         if self.iterator:
             if self.rownumber is None:
                 self.rownumber = 0
             else:
                 self.rownumber += 1
             values = next(self.iterator)
+            convertValue = self.converter.convertValue
+            dbType = self.dbType
+            types = self.types
             for i in range(0, len(values)):
-                values[i] = self.converter.convertValue(
-                    self.dbType, self.types[i][0], self.types[i][1], values[i])
+                values[i] = convertValue(
+                    dbType, types[i][0], types[i][1], values[i])
             row = Row(self.columns, values, self.rownumber + 1)
             # logger.debug("%s", row)
             return row